@@ -1,5 +1,5 @@
 
-import math  # For distance calculations in defender spawning
+import math  # For distance calculations in defender movement
 import random  # For randomization of positions, directions, and food spawns
 import sys  # For system-specific functions, used to exit the game
 import os  # For file path operations to load images and audio
@@ -18,6 +18,8 @@ import pygame  # type: ignore # Core library for graphics, input handling, and s
 WINDOW_WIDTH = 800  # Width of the game window in pixels
 WINDOW_HEIGHT = 600  # Height of the game window in pixels
 FPS = 60  # Frames per second, controls game update rate for smooth gameplay
+COUNTDOWN_FRAMES = 3 * FPS  # Length of the pre-round countdown
+KEY_COOLDOWN_FRAMES = 6  # Minimum frames between accepted direction keys (~0.1 s)
 
 # File paths for assets, stored in a 'Pictures' folder relative to the script
 LOGO_RELATIVE_PATH = os.path.join(
@@ -26,6 +28,11 @@ RUGBY_BALL_PATH = os.path.join(
     'Pictures', 'Settings.png')  # Path to rugby ball image
 # Path to background music
 BG_MUSIC_PATH = os.path.join('Pictures', 'BackgroundSound.wav')
+_ROOT = os.path.dirname(os.path.abspath(__file__))  # Script directory
+ASSETS = {name: os.path.join(_ROOT, rel) for name, rel in (
+    ('logo', LOGO_RELATIVE_PATH),
+    ('ball', RUGBY_BALL_PATH),
+    ('music', BG_MUSIC_PATH))}  # Absolute asset paths, resolved once at import
 
 # Game state constants to manage different screens
 MENU = "menu"  # Main menu with logo and play button
@@ -37,10 +44,20 @@ TIME_SELECT = "time_select"  # Screen for selecting round duration
 GAME_OVER = "game_over"  # Game over screen with score and replay options
 
 
+# Random Helpers
+
+
+def fast_randint(a, b):  # Random integer in [a, b] without randint's rejection sampling
+    return a + int(random.random() * (b - a + 1))
+
+
 # Button Class
 
 
 class Button:  # Class for creating interactive UI buttons
+    __slots__ = ('rect', 'text', 'font', 'bg_color', 'text_color',
+                 'hover', 'alpha', '_cache', '_cache_key')  # Fixed attributes
+
     # Initialize button with position, text, font, and colors
     def __init__(self, rect, text, font, bg_color=(0, 0, 0), text_color=(255, 255, 255)):
         # Create Pygame Rect for positioning and collision
@@ -51,28 +68,37 @@ class Button:  # Class for creating interactive UI buttons
         self.text_color = text_color  # Text color (default white)
         self.hover = False  # Flag to track mouse hover
         self.alpha = 255  # Alpha for transparency, starts fully opaque
+        self._cache = None  # Composed button surface
+        self._cache_key = None  # State the cached surface was built from
 
     def _render_text(self):  # Render button text and center it
-        # Render text with antialiasing to make edges smooth
-        text_surf = self.font.render(self.text, True, self.text_color)
+        # Render text with antialiasing, reusing the display-format text cache
+        text_surf = render_cached(self.font, self.text, self.text_color)
         text_rect = text_surf.get_rect(
             center=self.rect.center)  # Center text in button
         return text_surf, text_rect  # Return text surface and rectangle
 
     def draw(self, surface):  # Draw button on the given surface
-        button_surface = pygame.Surface(
-            self.rect.size, pygame.SRCALPHA)  # Create transparent surface
-        button_surface.set_alpha(self.alpha)  # Set transparency level
-        pygame.draw.ellipse(button_surface, self.bg_color,
-                            button_surface.get_rect())  # Draw filled ellipse
-        pygame.draw.ellipse(button_surface, (255, 255, 255),
-                            button_surface.get_rect(), 2)  # Draw white border
-        text_surf, text_rect = self._render_text()  # Render text
-        text_rect.center = button_surface.get_rect().center  # Center text on button
-        # Blit text to button surface
-        button_surface.blit(text_surf, text_rect)
+        key = (self.rect.size, self.text, self.bg_color,
+               self.text_color, self.hover)  # Inputs that affect the look
+        if key != self._cache_key:  # Rebuild only when something changed
+            button_surface = pygame.Surface(
+                self.rect.size, pygame.SRCALPHA)  # Create transparent surface
+            pygame.draw.ellipse(button_surface, self.bg_color,
+                                button_surface.get_rect())  # Draw filled ellipse
+            pygame.draw.ellipse(button_surface, (255, 255, 255),
+                                button_surface.get_rect(), 2)  # Draw white border
+            text_surf, text_rect = self._render_text()  # Render text
+            text_rect.center = button_surface.get_rect().center  # Center text on button
+            # Blit text to button surface
+            button_surface.blit(text_surf, text_rect)
+            button_surface = button_surface.convert_alpha()  # Match display format
+            self._cache = button_surface  # Store composed surface
+            self._cache_key = key  # Remember what it was built from
+        # Fades only touch alpha, so apply it without rebuilding
+        self._cache.set_alpha(self.alpha)  # Set transparency level
         # Blit button to main surface
-        surface.blit(button_surface, self.rect.topleft)
+        surface.blit(self._cache, self.rect.topleft)
 
     def update(self, mouse_pos):  # Update button state based on mouse position
         # Set hover if mouse is over button
@@ -101,7 +127,38 @@ def load_image(path, max_w, max_h):  # Load and scale an image
     iw, ih = img.get_size()  # Get original dimensions
     scale = min(max_w / iw, max_h / ih, 1.0)  # Calculate scale factor
     new_size = (int(iw * scale), int(ih * scale))  # Compute scaled dimensions
-    return pygame.transform.smoothscale(img, new_size)  # Return scaled image
+    # Return scaled image, converted so blits skip per-pixel format conversion
+    return pygame.transform.smoothscale(img, new_size).convert_alpha()
+
+
+_scaled_cache = {}  # Scaled images keyed by (image id, width, height)
+
+
+def get_scaled(img, size):  # Return img scaled to size, scaling only once
+    key = (id(img), size[0], size[1])  # Cache key
+    scaled = _scaled_cache.get(key)  # Look up cached copy
+    if scaled is None:  # Not scaled yet
+        scaled = pygame.transform.smoothscale(
+            img, size).convert_alpha()  # Scale and match display format
+        _scaled_cache[key] = scaled  # Store for later frames
+    return scaled
+
+
+_overlay_cache = {}  # Full-screen overlays keyed by (color, alpha)
+
+
+def get_overlay(color, alpha):  # Return a reusable translucent full-screen overlay
+    overlay = _overlay_cache.get((color, alpha))  # Look up cached overlay
+    if overlay is None:  # Build once
+        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))  # Create overlay
+        overlay.fill(color)  # Fill
+        overlay = overlay.convert()  # Match display format
+        overlay.set_alpha(alpha)  # Set transparency
+        _overlay_cache[(color, alpha)] = overlay  # Store for later frames
+    return overlay
+
+
+_placeholder_font = None  # Font for placeholder labels, created on first use
 
 
 def draw_placeholder(surface, rect, text):  # Draw placeholder for missing images
@@ -109,92 +166,171 @@ def draw_placeholder(surface, rect, text):  # Draw placeholder for missing image
                      border_radius=8)  # Draw light gray rectangle
     pygame.draw.rect(surface, (140, 140, 140), rect, width=3,
                      border_radius=8)  # Draw darker border
-    font = pygame.font.SysFont(None, 20)  # Use default system font
+    global _placeholder_font
+    if _placeholder_font is None:  # Create font once, not every frame
+        _placeholder_font = pygame.font.SysFont(None, 20)  # Use default system font
+    font = _placeholder_font
     txt = font.render(text, True, (60, 60, 60))  # Render text in dark gray
     surface.blit(txt, txt.get_rect(center=rect.center))  # Blit centered text
 
 
+# Text Helpers
+text_cache = {}  # Rendered text keyed by (font id, text, color)
+
+
+def render_cached(font, text, color):  # Render text once and reuse the surface
+    key = (id(font), text, color)  # Cache key
+    surf = text_cache.get(key)  # Look up cached surface
+    if surf is None:  # Not rendered yet
+        if len(text_cache) > 512:  # Keep changing strings from piling up
+            text_cache.clear()
+        surf = font.render(text, True, color).convert_alpha()  # Render with antialiasing
+        text_cache[key] = surf  # Store for later frames
+    return surf
+
+
 # Rugby Pitch
 # Define centered rugby pitch rectangle
 pitch_rect = pygame.Rect(100, 100, 600, 400)
-
-
-def draw_pitch(screen):  # Draw rugby pitch with grass, borders, and goal posts
+_pitch_surface = None  # Cached pitch, built on first use
+CELL_CX = ()  # Pixel center x of each grid column, set by set_cell_centers
+CELL_CY = ()  # Pixel center y of each grid row
+ALL_CELLS = ()  # Every (x, y) grid cell, candidates for food
+
+
+def set_cell_centers(grid_w, grid_h, cell_size):  # Precompute grid cell centers
+    global CELL_CX, CELL_CY, ALL_CELLS
+    CELL_CX = tuple(pitch_rect.left + i * cell_size + cell_size // 2
+                    for i in range(grid_w))  # Column centers
+    CELL_CY = tuple(pitch_rect.top + j * cell_size + cell_size // 2
+                    for j in range(grid_h))  # Row centers
+    ALL_CELLS = tuple((x, y) for x in range(grid_w)
+                      for y in range(grid_h))  # Full cell list
+
+
+# Grid
+GRID_W = 30  # Grid width in cells
+GRID_H = 20  # Grid height in cells
+CELL_SIZE = 20  # Cell size in pixels
+if pitch_rect.width % CELL_SIZE != 0 or pitch_rect.height % CELL_SIZE != 0:  # Check grid alignment
+    print("Warning: Pitch dimensions not divisible by cell_size.")
+set_cell_centers(GRID_W, GRID_H, CELL_SIZE)  # Grid to pixel lookup tables
+
+
+def _build_pitch_surface():  # Draw background and rugby pitch with grass, borders, and goal posts
+    surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))  # Opaque surface
+    surface.fill((0, 0, 51))  # Fill background
     for i in range(0, pitch_rect.height, 40):  # Create alternating grass stripes
-        pygame.draw.rect(screen, (50, 150, 50), (pitch_rect.left,
+        pygame.draw.rect(surface, (50, 150, 50), (pitch_rect.left,
                          pitch_rect.top + i, pitch_rect.width, 20))  # Draw light green stripe
     # Draw dark green grass
-    pygame.draw.rect(screen, (34, 139, 34), pitch_rect)
-    pygame.draw.rect(screen, (255, 255, 255),
+    pygame.draw.rect(surface, (34, 139, 34), pitch_rect)
+    pygame.draw.rect(surface, (255, 255, 255),
                      pitch_rect, 5)  # Draw white border
-    pygame.draw.line(screen, (255, 255, 255), (pitch_rect.centerx, pitch_rect.top),
+    pygame.draw.line(surface, (255, 255, 255), (pitch_rect.centerx, pitch_rect.top),
                      (pitch_rect.centerx, pitch_rect.bottom), 3)  # Draw midline
     try_line_offset = 50  # Offset for try lines
-    pygame.draw.line(screen, (255, 255, 255), (pitch_rect.left, pitch_rect.top + try_line_offset),
+    pygame.draw.line(surface, (255, 255, 255), (pitch_rect.left, pitch_rect.top + try_line_offset),
                      # Top try line
                      (pitch_rect.right, pitch_rect.top + try_line_offset), 3)
-    pygame.draw.line(screen, (255, 255, 255), (pitch_rect.left, pitch_rect.bottom - try_line_offset),
+    pygame.draw.line(surface, (255, 255, 255), (pitch_rect.left, pitch_rect.bottom - try_line_offset),
                      # Bottom try line
                      (pitch_rect.right, pitch_rect.bottom - try_line_offset), 3)
     pole_height = 40  # Height of goal posts
     crossbar_width = 60  # Width of crossbar
     center_x = pitch_rect.centerx  # Center x for symmetry
-    pygame.draw.line(screen, (255, 255, 255), (center_x - crossbar_width // 2, pitch_rect.top + try_line_offset -
-                     # Top left pole
-                                               pole_height), (center_x - crossbar_width // 2, pitch_rect.top + try_line_offset), 5)
-    pygame.draw.line(screen, (255, 255, 255), (center_x + crossbar_width // 2, pitch_rect.top + try_line_offset -
-                     # Top right pole
-                                               pole_height), (center_x + crossbar_width // 2, pitch_rect.top + try_line_offset), 5)
-    pygame.draw.line(screen, (255, 255, 255), (center_x - crossbar_width // 2, pitch_rect.top + try_line_offset - pole_height //
-                     # Top crossbar
-                                               2), (center_x + crossbar_width // 2, pitch_rect.top + try_line_offset - pole_height // 2), 5)
-    pygame.draw.line(screen, (255, 255, 255), (center_x - crossbar_width // 2, pitch_rect.bottom - try_line_offset +
-                     # Bottom left pole
-                                               pole_height), (center_x - crossbar_width // 2, pitch_rect.bottom - try_line_offset), 5)
-    pygame.draw.line(screen, (255, 255, 255), (center_x + crossbar_width // 2, pitch_rect.bottom - try_line_offset +
-                     # Bottom right pole
-                                               pole_height), (center_x + crossbar_width // 2, pitch_rect.bottom - try_line_offset), 5)
-    pygame.draw.line(screen, (255, 255, 255), (center_x - crossbar_width // 2, pitch_rect.bottom - try_line_offset + pole_height // 2),
-                     # Bottom crossbar
-                     (center_x + crossbar_width // 2, pitch_rect.bottom - try_line_offset + pole_height // 2), 5)
+    left_post = center_x - crossbar_width // 2  # Left pole x
+    right_post = center_x + crossbar_width // 2  # Right pole x
+    for base_y, reach in ((pitch_rect.top + try_line_offset, -pole_height),
+                          (pitch_rect.bottom - try_line_offset, pole_height)):  # Top and bottom posts
+        tip_y = base_y + reach  # Far end of the poles
+        bar_y = base_y + reach // 2  # Crossbar height
+        # Left pole, crossbar, right pole as one polyline (poles retraced to the bar)
+        pygame.draw.lines(surface, (255, 255, 255), False,
+                          [(left_post, tip_y), (left_post, base_y), (left_post, bar_y),
+                           (right_post, bar_y), (right_post, tip_y), (right_post, base_y)], 5)
+    return surface.convert()  # Match display format, no per-pixel alpha
+
+
+def draw_pitch(screen):  # Blit the cached background and pitch, replacing a fill
+    global _pitch_surface
+    if _pitch_surface is None:  # Build once
+        _pitch_surface = _build_pitch_surface()
+    screen.blit(_pitch_surface, (0, 0))  # Blit pitch
+
+# Crowd
+CROWD_DOTS = tuple((fast_randint(0, 80), fast_randint(0, 600)) for _ in range(
+    # Crowd dot positions, generated once at import
+    50)) + tuple((fast_randint(720, 800), fast_randint(0, 600)) for _ in range(50))
+_crowd_surface = None  # Cached crowd dots, built on first use
+
+
+def get_crowd_surface():  # Return the pre-rendered crowd dots surface
+    global _crowd_surface
+    if _crowd_surface is None:  # Build once
+        _crowd_surface = pygame.Surface(
+            (WINDOW_WIDTH, WINDOW_HEIGHT))  # Opaque surface, black is keyed out
+        for x, y in CROWD_DOTS:  # Draw crowd
+            pygame.draw.circle(_crowd_surface, (255, 255, 255),
+                               (x, y), 2)  # Draw dot
+        _crowd_surface = _crowd_surface.convert()  # Match display format
+        # RLE colorkey blits skip the empty runs instead of blending every pixel
+        _crowd_surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+    return _crowd_surface
 
 # Menu Background Players
 
 
 class MenuBackgroundPlayer:  # Class for decorative players in menu
+    __slots__ = ('x', 'y', 'radius', 'color', 'dx', 'dy')  # Fixed attributes
+
     def __init__(self, color):  # Initialize with color
         # Random x within pitch
-        self.x = random.randint(pitch_rect.left + 20, pitch_rect.right - 20)
+        self.x = fast_randint(pitch_rect.left + 20, pitch_rect.right - 20)
         # Random y within pitch
-        self.y = random.randint(pitch_rect.top + 20, pitch_rect.bottom - 20)
+        self.y = fast_randint(pitch_rect.top + 20, pitch_rect.bottom - 20)
         self.radius = 15  # Circle radius
         self.color = color  # Player color
         self.dx = random.choice([-2, -1, 1, 2])  # Random x velocity
         self.dy = random.choice([-2, -1, 1, 2])  # Random y velocity
 
-    def move(self):  # Move player and bounce off pitch edges
-        self.x += self.dx  # Update x
-        self.y += self.dy  # Update y
-        if self.x - self.radius < pitch_rect.left or self.x + self.radius > pitch_rect.right:  # Check x bounds
-            self.dx *= -1  # Reverse x direction
-        if self.y - self.radius < pitch_rect.top or self.y + self.radius > pitch_rect.bottom:  # Check y bounds
-            self.dy *= -1  # Reverse y direction
 
-    def draw(self, screen):  # Draw player as a circle
-        pygame.draw.circle(screen, self.color, (int(self.x), int(
-            self.y)), self.radius, 0)  # Draw filled circle
+def update_menu_players(screen, bg_players):  # Move decorative players and draw them
+    left, right = pitch_rect.left, pitch_rect.right  # Pitch x bounds
+    top, bottom = pitch_rect.top, pitch_rect.bottom  # Pitch y bounds
+    circle = pygame.draw.circle  # Local alias for the loop
+    for p in bg_players:  # Single pass over all menu players
+        p.x += p.dx  # Update x
+        p.y += p.dy  # Update y
+        r = p.radius  # Circle radius
+        if p.x - r < left or p.x + r > right:  # Check x bounds
+            p.dx = -p.dx  # Reverse x direction
+        if p.y - r < top or p.y + r > bottom:  # Check y bounds
+            p.dy = -p.dy  # Reverse y direction
+        circle(screen, p.color, (int(p.x), int(p.y)), r, 0)  # Draw filled circle
 
 # Gameplay Defenders
 
 
 class BackgroundPlayer:  # Class for defenders chasing the player
-    # Initialize with player color, player ref, difficulty, and cell size
-    def __init__(self, player_color, player, difficulty, cell_size):
-        self.radius = 15  # Defender radius
+    __slots__ = ('radius', 'color', 'player', 'speed', 'x', 'y')  # Fixed attributes
+    RADIUS = 15  # Defender radius
+    MIN_X = pitch_rect.left + RADIUS  # Leftmost center that stays on the pitch
+    MAX_X = pitch_rect.right - RADIUS  # Rightmost center
+    MIN_Y = pitch_rect.top + RADIUS  # Topmost center
+    MAX_Y = pitch_rect.bottom - RADIUS  # Bottommost center
+
+    # Initialize with player color, player ref, and difficulty
+    def __init__(self, player_color, player, difficulty):
+        self.radius = self.RADIUS  # Defender radius
         color_options = [(255, 255, 0), (255, 0, 255),
                          (0, 255, 255)]  # Color options
         self.color = next((c for c in color_options if c != player_color),
                           color_options[0])  # Choose non-player color
+        self.reset(player, difficulty)  # Pick speed and spawn position
+
+    # Re-seed speed and position for a new round without reallocating
+    def reset(self, player, difficulty):
         self.player = player  # Store player reference
         if difficulty == "Easy":  # Set speed for Easy
             self.speed = 1.5
@@ -203,20 +339,18 @@ class BackgroundPlayer:  # Class for defenders chasing the player
         else:  # Set speed for Hard
             self.speed = 2.5
         min_distance = 100  # Minimum spawn distance from player
-        player_x = pitch_rect.left + player.x * \
-            cell_size + cell_size // 2  # Player center x
-        player_y = pitch_rect.top + player.y * \
-            cell_size + cell_size // 2  # Player center y
+        player_x = CELL_CX[player.x]  # Player center x
+        player_y = CELL_CY[player.y]  # Player center y
         spawn_attempts = 0  # Spawn attempt counter
         max_attempts = 100  # Max attempts to prevent infinite loop
         while True:  # Loop to find safe spawn
-            self.x = random.randint(
+            self.x = fast_randint(
                 pitch_rect.left + 20, pitch_rect.right - 20)  # Random x
-            self.y = random.randint(
+            self.y = fast_randint(
                 pitch_rect.top + 20, pitch_rect.bottom - 20)  # Random y
-            dist = math.sqrt((self.x - player_x)**2 +
-                             (self.y - player_y)**2)  # Distance to player
-            if dist >= min_distance:  # If safe
+            dx = self.x - player_x  # Delta x to player
+            dy = self.y - player_y  # Delta y to player
+            if dx * dx + dy * dy >= min_distance * min_distance:  # If safe
                 break  # Exit loop
             spawn_attempts += 1  # Increment attempts
             if spawn_attempts > max_attempts:  # If exceeded
@@ -227,39 +361,12 @@ class BackgroundPlayer:  # Class for defenders chasing the player
                 self.y = pitch_rect.top + 20  # Default y
                 break  # Exit
 
-    def move(self, cell_size, countdown_timer):  # Move defender towards player
-        if countdown_timer > 0:  # Skip if countdown active
-            return
-        head_x = pitch_rect.left + self.player.x * \
-            cell_size + cell_size // 2  # Player center x
-        head_y = pitch_rect.top + self.player.y * \
-            cell_size + cell_size // 2  # Player center y
-        dx = head_x - self.x  # Delta x
-        dy = head_y - self.y  # Delta y
-        dist = (dx**2 + dy**2)**0.5  # Euclidean distance
-        if dist > 0:  # Prevent division by zero
-            self.x += (dx / dist) * self.speed  # Move x
-            self.y += (dy / dist) * self.speed  # Move y
-        self.x = max(pitch_rect.left + self.radius, min(self.x,
-                     pitch_rect.right - self.radius))  # Clamp x
-        self.y = max(pitch_rect.top + self.radius, min(self.y,
-                     pitch_rect.bottom - self.radius))  # Clamp y
-
-    def draw(self, screen):  # Draw defender
-        pygame.draw.circle(screen, self.color, (int(self.x),
-                           int(self.y)), self.radius, 0)  # Draw circle
-
-    def collides_with_player(self, player, cell_size):  # Check collision with player
-        head_x = pitch_rect.left + player.x * \
-            cell_size + cell_size // 2  # Player center x
-        head_y = pitch_rect.top + player.y * cell_size + cell_size // 2  # Player center y
-        dist = ((self.x - head_x)**2 + (self.y - head_y)**2)**0.5  # Distance
-        return dist < self.radius + (cell_size // 2)  # True if collision
-
 # Player Class
 
 
 class Player:  # Class for the player
+    __slots__ = ('color', 'x', 'y', 'direction', 'radius')  # Fixed attributes
+
     def __init__(self, color, grid_w, grid_h):  # Initialize player
         if color is None:  # Validate color
             raise ValueError("Player color cannot be None")
@@ -286,9 +393,9 @@ class Player:  # Class for the player
         ate = (self.x, self.y) == food_pos  # Check if ate food
         return True, ate, False  # Continue, ate status, no wall
 
-    def draw(self, screen, cell_size):  # Draw player
-        cx = pitch_rect.left + self.x * cell_size + cell_size // 2  # Center x
-        cy = pitch_rect.top + self.y * cell_size + cell_size // 2  # Center y
+    def draw(self, screen):  # Draw player
+        cx = CELL_CX[self.x]  # Center x
+        cy = CELL_CY[self.y]  # Center y
         pygame.draw.circle(screen, self.color, (cx, cy),
                            self.radius)  # Draw circle
 
@@ -298,9 +405,7 @@ class Player:  # Class for the player
 def render_menu(screen, logo_img, play_button, title_font, small_font, bg_players):  # Render main menu
     w, h = screen.get_size()  # Get dimensions
     screen.fill((0, 0, 51))  # Fill dark blue
-    for p in bg_players:  # Update and draw background players
-        p.move()  # Move player
-        p.draw(screen)  # Draw player
+    update_menu_players(screen, bg_players)  # Update and draw background players
     if logo_img:  # If logo exists
         logo_rect = logo_img.get_rect(
             center=(w // 2, int(h * 0.3)))  # Center logo
@@ -309,39 +414,32 @@ def render_menu(screen, logo_img, play_button, title_font, small_font, bg_player
         placeholder_rect = pygame.Rect(
             w // 2 - 200, int(h * 0.3) - 75, 400, 150)  # Placeholder rect
         draw_placeholder(screen, placeholder_rect, "Logo")  # Draw placeholder
-    title_surf = title_font.render(
-        "RUGBY SNAKE", True, (255, 255, 255))  # Render title
+    title_surf = render_cached(
+        title_font, "RUGBY SNAKE", (255, 255, 255))  # Render title
     screen.blit(title_surf, title_surf.get_rect(
         center=(w // 2, int(h * 0.15))))  # Blit title
     play_button.draw(screen)  # Draw play button
-    note = small_font.render(
+    note = render_cached(
         # Render instruction
-        "Press SPACE or click Play to start", True, (255, 255, 0))
+        small_font, "Press SPACE or click Play to start", (255, 255, 0))
     screen.blit(note, note.get_rect(
         center=(w // 2, int(h * 0.85))))  # Blit instruction
 
 
 def render_welcome(screen, title_font, small_font, easy_btn, med_btn, hard_btn, logo_side_img, rugby_ball_img, bg_players):  # Render welcome screen
     w, h = screen.get_size()  # Get dimensions
-    screen.fill((0, 0, 51))  # Fill background
-    draw_pitch(screen)  # Draw pitch
-    crowd_dots = [(random.randint(0, 80), random.randint(0, 600)) for _ in range(
-        # Generate crowd dots
-        50)] + [(random.randint(720, 800), random.randint(0, 600)) for _ in range(50)]
-    for x, y in crowd_dots:  # Draw crowd
-        pygame.draw.circle(screen, (255, 255, 255), (x, y), 2)  # Draw dot
-    for p in bg_players:  # Draw background players
-        p.move()  # Move
-        p.draw(screen)  # Draw
-    welcome_surf = title_font.render(
-        "SELECT DIFFICULTY", True, (255, 255, 255))  # Render title
+    draw_pitch(screen)  # Draw background and pitch
+    screen.blit(get_crowd_surface(), (0, 0))  # Draw crowd
+    update_menu_players(screen, bg_players)  # Draw background players
+    welcome_surf = render_cached(
+        title_font, "SELECT DIFFICULTY", (255, 255, 255))  # Render title
     screen.blit(welcome_surf, welcome_surf.get_rect(
         center=(w // 2, 60)))  # Blit title
     if logo_side_img:  # If side logo
         screen.blit(logo_side_img, logo_side_img.get_rect(
             topleft=(20, 20)))  # Blit logo
     if rugby_ball_img:  # If ball image
-        rugby_ball_img_scaled = pygame.transform.scale(
+        rugby_ball_img_scaled = get_scaled(
             rugby_ball_img, (60, 60))  # Scale ball
         ball_rect = rugby_ball_img_scaled.get_rect(
             topright=(w - 10, 10))  # Get rect
@@ -363,8 +461,8 @@ def render_welcome(screen, title_font, small_font, easy_btn, med_btn, hard_btn,
 def render_color_selection(screen, title_font, small_font, color_buttons):
     w, h = screen.get_size()  # Get dimensions
     screen.fill((0, 0, 51))  # Fill background
-    title_surf = title_font.render(
-        "SELECT YOUR TEAM COLOR", True, (255, 255, 255))  # Render title
+    title_surf = render_cached(
+        title_font, "SELECT YOUR TEAM COLOR", (255, 255, 255))  # Render title
     screen.blit(title_surf, title_surf.get_rect(
         center=(w // 2, 80)))  # Blit title
     for btn in color_buttons:  # Draw buttons
@@ -375,8 +473,8 @@ def render_color_selection(screen, title_font, small_font, color_buttons):
 def render_time_selection(screen, title_font, small_font, time_buttons):
     w, h = screen.get_size()  # Get dimensions
     screen.fill((0, 0, 51))  # Fill background
-    title_surf = title_font.render(
-        "SELECT ROUND LENGTH (MIN)", True, (255, 255, 255))  # Render title
+    title_surf = render_cached(
+        title_font, "SELECT ROUND LENGTH (MIN)", (255, 255, 255))  # Render title
     screen.blit(title_surf, title_surf.get_rect(
         center=(w // 2, 80)))  # Blit title
     for btn in time_buttons:  # Draw buttons
@@ -385,35 +483,32 @@ def render_time_selection(screen, title_font, small_font, time_buttons):
 
 # Render settings screen with rules
 def render_settings(screen, title_font, small_font, sound_on, dark_mode, volume_level):
-    # Create overlay surface
-    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-    overlay.set_alpha(220)  # Set transparency
-    overlay.fill((10, 10, 40) if dark_mode else (
-        180, 200, 255))  # Fill based on theme
+    overlay = get_overlay((10, 10, 40) if dark_mode else (
+        180, 200, 255), 220)  # Overlay based on theme
     screen.blit(overlay, (0, 0))  # Blit overlay
-    title = title_font.render(
+    title = render_cached(
         # Render title
-        "SETTINGS ⚙️", True, (255, 255, 255) if dark_mode else (0, 0, 80))
+        title_font, "SETTINGS ⚙️", (255, 255, 255) if dark_mode else (0, 0, 80))
     screen.blit(title, title.get_rect(
         center=(WINDOW_WIDTH // 2, 80)))  # Blit title
     sound_status = "ON" if sound_on else "OFF"  # Sound status text
-    sound_text = small_font.render(
+    sound_text = render_cached(
         # Render sound
-        f"Sound: {sound_status}  (Press S to toggle)", True, (255, 255, 0))
+        small_font, f"Sound: {sound_status}  (Press S to toggle)", (255, 255, 0))
     screen.blit(sound_text, sound_text.get_rect(
         center=(WINDOW_WIDTH // 2, 180)))  # Blit sound
-    volume_text = small_font.render(
+    volume_text = render_cached(
         # Render volume
-        f"Volume: {int(volume_level * 100)}%  (Use ↑ / ↓)", True, (255, 255, 255))
+        small_font, f"Volume: {int(volume_level * 100)}%  (Use ↑ / ↓)", (255, 255, 255))
     screen.blit(volume_text, volume_text.get_rect(
         center=(WINDOW_WIDTH // 2, 230)))  # Blit volume
-    theme_text = small_font.render(
+    theme_text = render_cached(
         # Render theme
-        f"Theme: {'Dark' if dark_mode else 'Light'} (Press T to toggle)", True, (255, 255, 255))
+        small_font, f"Theme: {'Dark' if dark_mode else 'Light'} (Press T to toggle)", (255, 255, 255))
     screen.blit(theme_text, theme_text.get_rect(
         center=(WINDOW_WIDTH // 2, 280)))  # Blit theme
-    rules_title = small_font.render(
-        "Rules:", True, (255, 255, 255))  # Render rules title
+    rules_title = render_cached(
+        small_font, "Rules:", (255, 255, 255))  # Render rules title
     screen.blit(rules_title, rules_title.get_rect(
         center=(WINDOW_WIDTH // 2, 330)))  # Blit rules title
     rules = [  # List of game rules
@@ -426,13 +521,13 @@ def render_settings(screen, title_font, small_font, sound_on, dark_mode, volume_
         "Choose difficulty, color, and time before starting."  # Rule 6: Setup
     ]
     for i, line in enumerate(rules):  # Render each rule
-        text = small_font.render(
-            line, True, (200, 200, 200))  # Render rule text
+        text = render_cached(
+            small_font, line, (200, 200, 200))  # Render rule text
         # Blit rule, spaced vertically
         screen.blit(text, text.get_rect(
             center=(WINDOW_WIDTH // 2, 360 + i * 25)))
-    controls_title = small_font.render(
-        "Controls:", True, (255, 255, 255))  # Render controls title
+    controls_title = render_cached(
+        small_font, "Controls:", (255, 255, 255))  # Render controls title
     screen.blit(controls_title, controls_title.get_rect(
         # Blit below rules
         center=(WINDOW_WIDTH // 2, 360 + len(rules) * 25 + 30)))
@@ -444,34 +539,28 @@ def render_settings(screen, title_font, small_font, sound_on, dark_mode, volume_
         "P - Pause/Resume"
     ]
     for i, line in enumerate(controls):  # Render controls
-        text = small_font.render(
-            line, True, (200, 200, 200))  # Render control text
+        text = render_cached(
+            small_font, line, (200, 200, 200))  # Render control text
         screen.blit(text, text.get_rect(center=(WINDOW_WIDTH // 2, 360 +
                     len(rules) * 25 + 60 + i * 25)))  # Blit below rules title
-    note = small_font.render(
-        "Press ESC to return to Menu", True, (255, 100, 100))  # Render note
+    note = render_cached(
+        small_font, "Press ESC to return to Menu", (255, 100, 100))  # Render note
     screen.blit(note, note.get_rect(center=(WINDOW_WIDTH // 2, 360 +
                 len(rules) * 25 + 60 + len(controls) * 25 + 30)))  # Blit at bottom
 
 
-def render_playing(screen, title_font, small_font, player, food_pos, score, time_left_frames, countdown_timer, paused, rugby_ball_img, bg_players, pause_btn, quit_btn, cell_size, pitch_rect, lives):  # Render gameplay
+def render_playing(screen, title_font, small_font, player, food_pos, score, time_left_frames, countdown_timer, paused, food_img, bg_players, pause_btn, quit_btn, cell_size, pitch_rect, lives):  # Render gameplay
     if player is None:  # Validate player
         raise ValueError("Player object is None in render_playing")
     w, h = screen.get_size()  # Get dimensions
-    screen.fill((0, 0, 51))  # Fill background
-    draw_pitch(screen)  # Draw pitch
-    crowd_dots = [(random.randint(0, 80), random.randint(0, 600)) for _ in range(
-        # Generate crowd
-        50)] + [(random.randint(720, 800), random.randint(0, 600)) for _ in range(50)]
-    for x, y in crowd_dots:  # Draw crowd
-        pygame.draw.circle(screen, (255, 255, 255), (x, y), 2)  # Draw dot
+    draw_pitch(screen)  # Draw background and pitch
+    screen.blit(get_crowd_surface(), (0, 0))  # Draw crowd
+    circle = pygame.draw.circle  # Local alias for the defender loop
     for p in bg_players:  # Draw defenders
-        p.draw(screen)
-    player.draw(screen, cell_size)  # Draw player
-    if rugby_ball_img:  # Draw ball
-        ball_scaled = pygame.transform.smoothscale(
-            rugby_ball_img, (cell_size, cell_size))  # Scale
-        screen.blit(ball_scaled, (pitch_rect.left +
+        circle(screen, p.color, (int(p.x), int(p.y)), p.radius)  # Draw circle
+    player.draw(screen)  # Draw player
+    if food_img:  # Draw ball, already scaled to cell_size
+        screen.blit(food_img, (pitch_rect.left +
                     # Blit
                                   food_pos[0] * cell_size, pitch_rect.top + food_pos[1] * cell_size))
     else:  # Fallback
@@ -482,12 +571,12 @@ def render_playing(screen, title_font, small_font, player, food_pos, score, time
     minn = time_left_sec // 60  # Minutes
     sec = time_left_sec % 60  # Seconds
     time_str = f"{minn:02d}:{sec:02d}"  # Format time
-    score_surf = small_font.render(
-        f"Score: {score}", True, (255, 255, 255))  # Render score
-    time_surf = small_font.render(
-        f"Time: {time_str}", True, (255, 255, 255))  # Render time
-    lives_surf = small_font.render(
-        f"Lives: {lives}", True, (255, 255, 255))  # Render lives
+    score_surf = render_cached(
+        small_font, f"Score: {score}", (255, 255, 255))  # Render score
+    time_surf = render_cached(
+        small_font, f"Time: {time_str}", (255, 255, 255))  # Render time
+    lives_surf = render_cached(
+        small_font, f"Lives: {lives}", (255, 255, 255))  # Render lives
     screen.blit(score_surf, (pitch_rect.left, 20))  # Blit score
     screen.blit(time_surf, (pitch_rect.left +
                 score_surf.get_width() + 20, 20))  # Blit time
@@ -497,20 +586,16 @@ def render_playing(screen, title_font, small_font, player, food_pos, score, time
     quit_btn.draw(screen)  # Draw quit
     if countdown_timer > 0:  # Draw countdown
         cd_num = (countdown_timer // FPS) + 1  # Calculate number
-        cd_surf = title_font.render(str(cd_num), True, (255, 0, 0))  # Render
+        cd_surf = render_cached(title_font, str(cd_num), (255, 0, 0))  # Render
         screen.blit(cd_surf, cd_surf.get_rect(center=(w // 2, h // 2)))  # Blit
     if paused:  # Draw pause overlay
-        overlay = pygame.Surface(
-            (WINDOW_WIDTH, WINDOW_HEIGHT))  # Create overlay
-        overlay.set_alpha(200)  # Set alpha
-        overlay.fill((10, 10, 40))  # Fill
-        screen.blit(overlay, (0, 0))  # Blit
-        paused_surf = title_font.render(
-            "PAUSED", True, (255, 255, 0))  # Render paused
-        pause_score = small_font.render(
-            f"Score: {score}", True, (255, 255, 255))  # Render score
-        pause_time = small_font.render(
-            f"Time Left: {time_str}", True, (255, 255, 255))  # Render time
+        screen.blit(get_overlay((10, 10, 40), 200), (0, 0))  # Blit overlay
+        paused_surf = render_cached(
+            title_font, "PAUSED", (255, 255, 0))  # Render paused
+        pause_score = render_cached(
+            small_font, f"Score: {score}", (255, 255, 255))  # Render score
+        pause_time = render_cached(
+            small_font, f"Time Left: {time_str}", (255, 255, 255))  # Render time
         screen.blit(paused_surf, paused_surf.get_rect(
             center=(w // 2, h // 2 - 50)))  # Blit paused
         screen.blit(pause_score, pause_score.get_rect(
@@ -519,13 +604,15 @@ def render_playing(screen, title_font, small_font, player, food_pos, score, time
             center=(w // 2, h // 2 + 50)))  # Blit time
 
 
-def render_game_over(screen, title_font, small_font, final_score, restart_same_btn, restart_diff_btn, quit_btn):  # Render game over
-    w, h = screen.get_size()  # Get dimensions
-    screen.fill((0, 0, 51))  # Fill background
+_game_over_cache = {"score": None, "lines": []}  # Game over text for the last score
+
+
+def _build_game_over_lines(title_font, small_font, final_score, w, h):  # Render game over text once
+    lines = []  # (surface, rect) pairs to blit
     title_surf = title_font.render(
         "Game Over!", True, (255, 0, 0))  # Render title
-    screen.blit(title_surf, title_surf.get_rect(
-        center=(w // 2, h // 2 - 150)))  # Blit title
+    lines.append((title_surf, title_surf.get_rect(
+        center=(w // 2, h // 2 - 150))))  # Place title
     congrats_messages = [  # Score-based messages
         (100, "Legendary Try! You're a rugby superstar!"),
         (50, "Solid Scrum! Great effort out there!"),
@@ -545,19 +632,31 @@ def render_game_over(screen, title_font, small_font, final_score, restart_same_b
             "Next game, your glory will unfold!"
         ]
         for i, line in enumerate(poem_lines):  # Render poem
-            poem_surf = small_font.render(
-                line, True, (255, 255, 0))  # Render line
-            screen.blit(poem_surf, poem_surf.get_rect(
-                center=(w // 2, h // 2 - 100 + i * 30)))  # Blit line
+            poem_surf = render_cached(
+                small_font, line, (255, 255, 0))  # Render line
+            lines.append((poem_surf, poem_surf.get_rect(
+                center=(w // 2, h // 2 - 100 + i * 30))))  # Place line
     else:  # Non-zero score
-        congrats_surf = small_font.render(
-            congrats_text, True, (255, 255, 0))  # Render message
-        screen.blit(congrats_surf, congrats_surf.get_rect(
-            center=(w // 2, h // 2 - 100)))  # Blit
-    score_surf = small_font.render(
-        f"Final Score: {final_score}", True, (255, 255, 255))  # Render score
-    screen.blit(score_surf, score_surf.get_rect(
-        center=(w // 2, h // 2 - 50)))  # Blit score
+        congrats_surf = render_cached(
+            small_font, congrats_text, (255, 255, 0))  # Render message
+        lines.append((congrats_surf, congrats_surf.get_rect(
+            center=(w // 2, h // 2 - 100))))  # Place message
+    score_surf = render_cached(
+        small_font, f"Final Score: {final_score}", (255, 255, 255))  # Render score
+    lines.append((score_surf, score_surf.get_rect(
+        center=(w // 2, h // 2 - 50))))  # Place score
+    return lines
+
+
+def render_game_over(screen, title_font, small_font, final_score, restart_same_btn, restart_diff_btn, quit_btn):  # Render game over
+    w, h = screen.get_size()  # Get dimensions
+    screen.fill((0, 0, 51))  # Fill background
+    if _game_over_cache["score"] != final_score:  # New result, rebuild text
+        _game_over_cache["lines"] = _build_game_over_lines(
+            title_font, small_font, final_score, w, h)
+        _game_over_cache["score"] = final_score
+    for surf, rect in _game_over_cache["lines"]:  # Blit cached text
+        screen.blit(surf, rect)
     restart_same_btn.draw(screen)  # Draw restart same
     restart_diff_btn.draw(screen)  # Draw restart diff
     quit_btn.draw(screen)  # Draw quit
@@ -566,28 +665,64 @@ def render_game_over(screen, title_font, small_font, final_score, restart_same_b
 
 
 # Spawn food avoiding player and defenders
-def spawn_food(player_pos, bg_players, grid_w, grid_h, cell_size):
-    spawn_attempts = 0  # Attempt counter
-    max_attempts = 100  # Max attempts
-    while True:  # Loop for position
-        x = random.randint(0, grid_w - 1)  # Random x
-        y = random.randint(0, grid_h - 1)  # Random y
-        if (x, y) != (player_pos.x, player_pos.y):  # Not on player
-            food_x = pitch_rect.left + x * cell_size + cell_size // 2  # Food x
-            food_y = pitch_rect.top + y * cell_size + cell_size // 2  # Food y
-            safe = True  # Assume safe
-            for p in bg_players:  # Check defenders
-                dist = math.sqrt((p.x - food_x)**2 +
-                                 (p.y - food_y)**2)  # Distance
-                if dist < p.radius + (cell_size // 2):  # If overlap
-                    safe = False  # Not safe
-                    break
-            if safe:  # If safe
-                return (x, y)  # Return position
-        spawn_attempts += 1  # Increment
-        if spawn_attempts > max_attempts:  # If exceeded
-            print("Warning: Could not find safe food spawn. Using default.")  # Warn
-            return (grid_w // 2 + 1, grid_h // 2 + 1)  # Fallback
+def spawn_food(player_pos, bg_players):  # Uses the module grid, like CELL_CX/CELL_CY/ALL_CELLS
+    blocked = {(player_pos.x, player_pos.y)}  # Cells food must not use
+    half = CELL_SIZE // 2  # Offset from cell corner to center
+    for p in bg_players:  # Mark cells each defender overlaps
+        reach = p.radius + half  # Overlap distance
+        reach_sq = reach * reach  # Squared threshold, so no square root is needed
+        # Only cells inside the defender's bounding box can overlap it
+        x0 = max(0, int(p.x - reach - pitch_rect.left) // CELL_SIZE)
+        x1 = min(GRID_W - 1, int(p.x + reach - pitch_rect.left) // CELL_SIZE)
+        y0 = max(0, int(p.y - reach - pitch_rect.top) // CELL_SIZE)
+        y1 = min(GRID_H - 1, int(p.y + reach - pitch_rect.top) // CELL_SIZE)
+        for x in range(x0, x1 + 1):  # Scan box columns
+            dx = p.x - CELL_CX[x]  # Delta x
+            for y in range(y0, y1 + 1):  # Scan box rows
+                dy = p.y - CELL_CY[y]  # Delta y
+                if dx * dx + dy * dy < reach_sq:  # If overlap
+                    blocked.add((x, y))  # Not safe
+    valid = [cell for cell in ALL_CELLS if cell not in blocked]  # Every safe cell
+    if valid:  # Pick uniformly among safe cells
+        return random.choice(valid)
+    print("Warning: Could not find safe food spawn. Using default.")  # Warn
+    return (GRID_W // 2 + 1, GRID_H // 2 + 1)  # Fallback
+
+
+def update_defenders(bg_players, player):  # Move all defenders towards player
+    head_x = CELL_CX[player.x]  # Player center x, shared by every defender
+    head_y = CELL_CY[player.y]  # Player center y
+    lo_x, hi_x = BackgroundPlayer.MIN_X, BackgroundPlayer.MAX_X  # Clamp x bounds
+    lo_y, hi_y = BackgroundPlayer.MIN_Y, BackgroundPlayer.MAX_Y  # Clamp y bounds
+    for p in bg_players:  # Single pass over all defenders
+        dx = head_x - p.x  # Delta x
+        dy = head_y - p.y  # Delta y
+        dist = math.hypot(dx, dy)  # Euclidean distance in one C call
+        if dist > 0:  # Prevent division by zero
+            step = p.speed / dist  # Scale delta to defender speed
+            p.x += dx * step  # Move x
+            p.y += dy * step  # Move y
+        if p.x < lo_x:  # Clamp x
+            p.x = lo_x
+        elif p.x > hi_x:
+            p.x = hi_x
+        if p.y < lo_y:  # Clamp y
+            p.y = lo_y
+        elif p.y > hi_y:
+            p.y = hi_y
+
+
+def defender_hits_player(bg_players, player, cell_size):  # Check collision with player
+    head_x = CELL_CX[player.x]  # Player center x
+    head_y = CELL_CY[player.y]  # Player center y
+    half = cell_size // 2  # Half a cell
+    for p in bg_players:  # Stop at the first defender that reaches the player
+        reach = p.radius + half  # Collision distance
+        dx = p.x - head_x  # Delta x
+        dy = p.y - head_y  # Delta y
+        if dx * dx + dy * dy < reach * reach:  # Squared compare skips the root
+            return True
+    return False
 
 # Main Game Loop
 
@@ -605,24 +740,26 @@ def main():  # Main function
         pygame.quit()
         sys.exit(1)
     pygame.display.set_caption("Rugby Snake")  # Set title
+    # Drop events the loop never reads; mouse position is polled each frame instead
+    pygame.event.set_blocked(
+        [pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP, pygame.KEYUP])
     clock = pygame.time.Clock()  # Create clock
     try:  # Try fonts
         title_font = pygame.font.SysFont(None, 48)  # Title font
         small_font = pygame.font.SysFont(None, 24)  # Small font
+        button_font = pygame.font.SysFont(None, 28)  # Shared button font
     except Exception as e:  # Catch font errors
         print(f"Error creating fonts: {e}")
         title_font = pygame.font.Font(None, 48)  # Fallback
         small_font = pygame.font.Font(None, 24)  # Fallback
-    project_root = os.path.dirname(os.path.abspath(__file__))  # Get root dir
-    logo_img = load_image(os.path.join(project_root, LOGO_RELATIVE_PATH),
+        button_font = pygame.font.Font(None, 28)  # Fallback
+    logo_img = load_image(ASSETS['logo'],
                           WINDOW_WIDTH * 0.7, WINDOW_HEIGHT * 0.35)  # Load logo
-    logo_side_img = load_image(os.path.join(
-        project_root, LOGO_RELATIVE_PATH), 100, 100)  # Load side logo
-    rugby_ball_img = load_image(os.path.join(
-        project_root, RUGBY_BALL_PATH), 100, 100)  # Load ball
+    logo_side_img = load_image(ASSETS['logo'], 100, 100)  # Load side logo
+    rugby_ball_img = load_image(ASSETS['ball'], 100, 100)  # Load ball
     try:  # Try audio
         pygame.mixer.init()
-        music_path = os.path.join(project_root, BG_MUSIC_PATH)
+        music_path = ASSETS['music']
         if os.path.isfile(music_path):
             pygame.mixer.music.load(music_path)
             pygame.mixer.music.set_volume(0.5)
@@ -633,17 +770,18 @@ def main():  # Main function
         print(f"Error initializing audio: {e}")
     except Exception as e:
         print(f"Unexpected audio error: {e}")
+    mixer_ok = pygame.mixer.get_init() is not None  # Audio available, checked once
     play_button = Button((WINDOW_WIDTH // 2 - 110, int(WINDOW_HEIGHT * 0.65),
                          # Play button
-                          220, 60), "Play", pygame.font.SysFont(None, 28))
+                          220, 60), "Play", button_font)
     easy_btn = Button((0, 0, 180, 60), "Easy",
-                      pygame.font.SysFont(None, 28))  # Easy button
+                      button_font)  # Easy button
     easy_btn.alpha = 0  # Start invisible
     med_btn = Button((0, 0, 180, 60), "Medium",
-                     pygame.font.SysFont(None, 28))  # Medium button
+                     button_font)  # Medium button
     med_btn.alpha = 0
     hard_btn = Button((0, 0, 220, 60), "For the Brave!",
-                      pygame.font.SysFont(None, 28))  # Hard button
+                      button_font)  # Hard button
     hard_btn.alpha = 0
     menu_bg_players = [MenuBackgroundPlayer((0, 0, 255)) for _ in range(
         # Background players
@@ -653,21 +791,20 @@ def main():  # Main function
               ("Green", (0, 200, 0)), ("Black", (20, 20, 20))]  # Colors
     for name, color in colors:  # Create color buttons
         btn = Button((0, 0, 80, 50), name,
-                     pygame.font.SysFont(None, 28), bg_color=color)
+                     button_font, bg_color=color)
         btn.alpha = 0
         color_buttons.append(btn)
     time_buttons = []  # Time buttons
     for i in range(1, 6):  # Create time buttons
-        btn = Button((0, 0, 60, 60), str(i), pygame.font.SysFont(
-            None, 28), bg_color=(0, 150, 0))
+        btn = Button((0, 0, 60, 60), str(i), button_font, bg_color=(0, 150, 0))
         btn.alpha = 0
         time_buttons.append(btn)
     restart_same_btn = Button(
-        (0, 0, 200, 60), "Restart", pygame.font.SysFont(None, 28))  # Restart same
+        (0, 0, 200, 60), "Restart", button_font)  # Restart same
     restart_diff_btn = Button((0, 0, 300, 60), "Restart with Different Color/Time",
-                              pygame.font.SysFont(None, 28))  # Restart diff
+                              button_font)  # Restart diff
     quit_btn_go = Button((0, 0, 200, 60), "Quit to Menu",
-                         pygame.font.SysFont(None, 28))  # Quit button
+                         button_font)  # Quit button
     state = MENU  # Start state
     frame_count = 0  # Frame counter
     sound_on = True  # Sound on
@@ -682,6 +819,7 @@ def main():  # Main function
     score = 0  # Score
     final_score = 0  # Final score
     time_left_frames = 0  # Time frames
+    round_frames = 0  # Frames in a full round
     countdown_timer = 0  # Countdown
     move_counter = 0  # Move counter
     move_delay = 0  # Move delay
@@ -689,19 +827,27 @@ def main():  # Main function
     paused = False  # Paused
     pause_btn = None  # Pause button
     quit_btn = None  # Quit button
-    grid_w = 30  # Grid width
-    grid_h = 20  # Grid height
-    cell_size = 20  # Cell size
-    if pitch_rect.width % cell_size != 0 or pitch_rect.height % cell_size != 0:  # Check grid alignment
-        print("Warning: Pitch dimensions not divisible by cell_size.")
+    grid_w = GRID_W  # Grid width
+    grid_h = GRID_H  # Grid height
+    cell_size = CELL_SIZE  # Cell size
+    food_img = None  # Ball sprite scaled to one cell
+    if rugby_ball_img:  # Scale once, quality filter paid a single time
+        food_img = get_scaled(rugby_ball_img, (cell_size, cell_size))
     bg_players = []  # Defenders list
     lives = 3  # Lives
-    last_key_time = 0  # Last key time
-    key_cooldown = 0.1  # Key cooldown
+    last_key_frame = -KEY_COOLDOWN_FRAMES  # Frame of the last accepted key
+    last_mouse_pos = None  # Mouse position at the last hover update
+    hover_state = None  # State the hover flags were last refreshed for
+    hover_dirty_frames = 0  # Frames left that must refresh hover regardless
+    fps = FPS  # Local aliases for globals the loop reads every frame
+    pitch = pitch_rect
+    get_mouse_pos = pygame.mouse.get_pos
+    get_events = pygame.event.get
+    flip_display = pygame.display.flip
 
     while True:  # Main loop
-        mouse_pos = pygame.mouse.get_pos()  # Get mouse pos
-        for event in pygame.event.get():  # Process events
+        mouse_pos = get_mouse_pos()  # Get mouse pos
+        for event in get_events():  # Process events
             if event.type == pygame.QUIT:  # Quit event
                 pygame.mixer.quit()  # Quit mixer
                 pygame.quit()  # Quit Pygame
@@ -761,15 +907,17 @@ def main():  # Main function
                             initial_move_delay = 5
                             num_defenders = 6
                         player = Player(selected_color, grid_w, grid_h)
-                        food_pos = spawn_food(
-                            player, bg_players, grid_w, grid_h, cell_size)
+                        bg_players = [BackgroundPlayer(
+                            selected_color, player, selected_difficulty) for _ in range(num_defenders)]
+                        food_pos = spawn_food(player, bg_players)
                         score = 0
                         lives = 3
-                        time_left_frames = selected_time * 60 * FPS
-                        countdown_timer = 3 * FPS
+                        round_frames = selected_time * 60 * FPS  # Reused by restarts
+                        # frame_count restarts on menu screens, so clear the old key frame
+                        last_key_frame = frame_count - KEY_COOLDOWN_FRAMES
+                        time_left_frames = round_frames
+                        countdown_timer = COUNTDOWN_FRAMES
                         move_counter = 0
-                        bg_players = [BackgroundPlayer(
-                            selected_color, player, selected_difficulty, cell_size) for _ in range(num_defenders)]
                         paused = False
                         pause_btn = Button(
                             (600, 20, 100, 50), "Pause", small_font)
@@ -778,25 +926,25 @@ def main():  # Main function
                                           "Quit", small_font)
                         quit_btn.alpha = 255
                         state = PLAYING
-                        if pygame.mixer.get_init():
+                        if mixer_ok:
                             pygame.mixer.music.fadeout(1000)
             elif state == SETTINGS:  # Settings state
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_s:
                         sound_on = not sound_on
-                        if pygame.mixer.get_init():
+                        if mixer_ok:
                             pygame.mixer.music.set_volume(
                                 volume_level if sound_on else 0)
                     elif event.key == pygame.K_t:
                         dark_mode = not dark_mode
                     elif event.key == pygame.K_UP:
                         volume_level = min(volume_level + 0.1, 1.0)
-                        if pygame.mixer.get_init():
+                        if mixer_ok:
                             pygame.mixer.music.set_volume(
                                 volume_level if sound_on else 0)
                     elif event.key == pygame.K_DOWN:
                         volume_level = max(volume_level - 0.1, 0.0)
-                        if pygame.mixer.get_init():
+                        if mixer_ok:
                             pygame.mixer.music.set_volume(
                                 volume_level if sound_on else 0)
                     elif event.key == pygame.K_ESCAPE:
@@ -808,9 +956,8 @@ def main():  # Main function
                         if pause_btn:
                             pause_btn.text = "Resume" if paused else "Pause"
                     if not paused and countdown_timer == 0:
-                        current_time = pygame.time.get_ticks() / 1000
-                        if current_time - last_key_time > key_cooldown:
-                            last_key_time = current_time
+                        if frame_count - last_key_frame >= KEY_COOLDOWN_FRAMES:
+                            last_key_frame = frame_count
                             if event.key in (pygame.K_UP, pygame.K_w):
                                 player.change_direction((0, -1))
                             elif event.key in (pygame.K_DOWN, pygame.K_s):
@@ -825,7 +972,7 @@ def main():  # Main function
                 if quit_btn and quit_btn.is_clicked(event):
                     final_score = score
                     state = GAME_OVER
-                    if pygame.mixer.get_init():
+                    if mixer_ok:
                         pygame.mixer.music.play(-1, fade_ms=1000)
             elif state == GAME_OVER:  # Game over state
                 if restart_same_btn.is_clicked(event):
@@ -834,20 +981,19 @@ def main():  # Main function
                         state = MENU
                         continue
                     player = Player(selected_color, grid_w, grid_h)
-                    food_pos = spawn_food(
-                        player, bg_players, grid_w, grid_h, cell_size)
+                    for p in bg_players:  # Reuse defenders from the last round
+                        p.reset(player, selected_difficulty)
+                    food_pos = spawn_food(player, bg_players)
                     score = 0
                     lives = 3
-                    time_left_frames = selected_time * 60 * FPS
-                    countdown_timer = 3 * FPS
+                    time_left_frames = round_frames
+                    countdown_timer = COUNTDOWN_FRAMES
                     move_counter = 0
                     move_delay = initial_move_delay
-                    bg_players = [BackgroundPlayer(
-                        selected_color, player, selected_difficulty, cell_size) for _ in range(num_defenders)]
                     paused = False
                     if pause_btn:
                         pause_btn.text = "Pause"
-                    if pygame.mixer.get_init():
+                    if mixer_ok:
                         pygame.mixer.music.fadeout(1000)
                     state = PLAYING
                 elif restart_diff_btn.is_clicked(event):
@@ -855,10 +1001,10 @@ def main():  # Main function
                     frame_count = 0
                 elif quit_btn_go.is_clicked(event):
                     state = MENU
-                    if pygame.mixer.get_init():
+                    if mixer_ok:
                         pygame.mixer.music.play(-1, fade_ms=1000)
         frame_count += 1  # Increment frame counter
-        dt = clock.tick(FPS) / 1000.0  # Delta time
+        dt = clock.tick(fps) / 1000.0  # Delta time
         if state == WELCOME:  # Fade in difficulty buttons
             if frame_count > 20:
                 easy_btn.alpha = min(easy_btn.alpha + 5, 255)
@@ -899,8 +1045,7 @@ def main():  # Main function
                 if countdown_timer > 0:
                     countdown_timer -= 1
                 else:
-                    for p in bg_players:
-                        p.move(cell_size, countdown_timer)
+                    update_defenders(bg_players, player)
                     move_counter += 1
                     if move_counter >= move_delay:
                         move_counter = 0
@@ -909,55 +1054,62 @@ def main():  # Main function
                         if not success:
                             final_score = score
                             state = GAME_OVER
-                            if pygame.mixer.get_init():
+                            if mixer_ok:
                                 pygame.mixer.music.play(-1, fade_ms=1000)
                         if ate:
                             score += 10
                             move_delay = max(2, move_delay - 0.5)
-                            food_pos = spawn_food(
-                                player, bg_players, grid_w, grid_h, cell_size)
+                            food_pos = spawn_food(player, bg_players)
                         if hit_wall:
-                            score = max(0, score - 5)
-                    collision_occurred = False
-                    for p in bg_players:
-                        if p.collides_with_player(player, cell_size) and not collision_occurred:
-                            collision_occurred = True
-                            lives -= 1
-                            if lives <= 0:
-                                final_score = score
-                                state = GAME_OVER
-                                if pygame.mixer.get_init():
-                                    pygame.mixer.music.play(-1, fade_ms=1000)
-                            else:
-                                player = Player(player.color, grid_w, grid_h)
-                                food_pos = spawn_food(
-                                    player, bg_players, grid_w, grid_h, cell_size)
-                                bg_players = [BackgroundPlayer(
-                                    player.color, player, selected_difficulty, cell_size) for _ in range(num_defenders)]
-                                move_delay = initial_move_delay
-                    time_left_frames -= int(dt * FPS)
+                            score -= 5  # Wall penalty
+                            if score < 0:  # Never below zero
+                                score = 0
+                    if defender_hits_player(bg_players, player, cell_size):
+                        lives -= 1
+                        if lives <= 0:
+                            final_score = score
+                            state = GAME_OVER
+                            if mixer_ok:
+                                pygame.mixer.music.play(-1, fade_ms=1000)
+                        else:
+                            player = Player(player.color, grid_w, grid_h)
+                            for p in bg_players:  # Respawn defenders in place
+                                p.reset(player, selected_difficulty)
+                            food_pos = spawn_food(player, bg_players)
+                            move_delay = initial_move_delay
+                    time_left_frames -= int(dt * fps)
                     if time_left_frames <= 0:
                         final_score = score
                         state = GAME_OVER
-                        if pygame.mixer.get_init():
+                        if mixer_ok:
                             pygame.mixer.music.play(-1, fade_ms=1000)
-        if state == MENU:  # Update buttons
-            play_button.update(mouse_pos)
-        elif state == WELCOME:
-            [btn.update(mouse_pos) for btn in [easy_btn, med_btn, hard_btn]]
-        elif state == COLOR_SELECT:
-            [btn.update(mouse_pos) for btn in color_buttons]
-        elif state == TIME_SELECT:
-            [btn.update(mouse_pos) for btn in time_buttons]
-        elif state == PLAYING:
-            if pause_btn:
-                pause_btn.update(mouse_pos)
-            if quit_btn:
-                quit_btn.update(mouse_pos)
-        elif state == GAME_OVER:
-            restart_same_btn.update(mouse_pos)
-            restart_diff_btn.update(mouse_pos)
-            quit_btn_go.update(mouse_pos)
+        if state != hover_state:  # Buttons of a new screen need fresh hover
+            hover_state = state
+            hover_dirty_frames = 2  # Some screens position buttons while rendering
+        # Skip while idle, and on the settings screen, which has no buttons
+        if state != SETTINGS and (mouse_pos != last_mouse_pos or hover_dirty_frames > 0):
+            last_mouse_pos = mouse_pos
+            hover_dirty_frames = max(hover_dirty_frames - 1, 0)
+            if state == MENU:  # Update buttons
+                play_button.update(mouse_pos)
+            elif state == WELCOME:
+                for btn in (easy_btn, med_btn, hard_btn):
+                    btn.update(mouse_pos)
+            elif state == COLOR_SELECT:
+                for btn in color_buttons:
+                    btn.update(mouse_pos)
+            elif state == TIME_SELECT:
+                for btn in time_buttons:
+                    btn.update(mouse_pos)
+            elif state == PLAYING:
+                if pause_btn:
+                    pause_btn.update(mouse_pos)
+                if quit_btn:
+                    quit_btn.update(mouse_pos)
+            elif state == GAME_OVER:
+                restart_same_btn.update(mouse_pos)
+                restart_diff_btn.update(mouse_pos)
+                quit_btn_go.update(mouse_pos)
         if state == MENU:  # Render
             render_menu(screen, logo_img, play_button,
                         title_font, small_font, menu_bg_players)
@@ -974,11 +1126,11 @@ def main():  # Main function
                             sound_on, dark_mode, volume_level)
         elif state == PLAYING:
             render_playing(screen, title_font, small_font, player, food_pos, score, time_left_frames, countdown_timer,
-                           paused, rugby_ball_img, bg_players, pause_btn, quit_btn, cell_size, pitch_rect, lives)
+                           paused, food_img, bg_players, pause_btn, quit_btn, cell_size, pitch, lives)
         elif state == GAME_OVER:
             render_game_over(screen, title_font, small_font, final_score,
                              restart_same_btn, restart_diff_btn, quit_btn_go)
-        pygame.display.flip()  # Update display
+        flip_display()  # Update display
 
 
 if __name__ == "__main__":  # Entry point